@@ -56,6 +56,66 @@ class EvalMetrics:
     return d
 
 
+@dataclass(slots=True)
+class _Counts:
+  """Running totals for a group of results, lifted into EvalMetrics on demand."""
+
+  n: int = 0
+  passed: int = 0
+  failed: int = 0
+  errored: int = 0
+  no_tests: int = 0
+  steps: int = 0
+  tool_calls: int = 0
+  duration: float = 0.0
+  reflections: int = 0
+  parse_errors: int = 0
+  test_runs: int = 0
+
+  def add(self, r: TaskResult) -> None:
+    self.n += 1
+    if r.error:
+      self.errored += 1
+    elif r.success is True:
+      self.passed += 1
+    elif r.success is False:
+      self.failed += 1
+    else:
+      self.no_tests += 1
+
+    self.steps += r.steps
+    self.tool_calls += r.tool_calls
+    self.duration += r.duration_s
+    self.reflections += r.reflection_count
+    self.parse_errors += r.parse_errors
+    self.test_runs += r.test_runs
+
+  def to_metrics(self) -> EvalMetrics:
+    n = self.n
+    if n == 0:
+      return EvalMetrics()
+
+    tested = self.passed + self.failed
+    return EvalMetrics(
+        total_tasks=n,
+        passed=self.passed,
+        failed=self.failed,
+        errored=self.errored,
+        no_tests=self.no_tests,
+        # Success rate excludes errored and no_tests
+        success_rate=self.passed / tested if tested > 0 else 0.0,
+        avg_steps=self.steps / n,
+        avg_tool_calls=self.tool_calls / n,
+        avg_duration_s=self.duration / n,
+        total_duration_s=self.duration,
+        avg_reflections=self.reflections / n,
+        avg_parse_errors=self.parse_errors / n,
+        avg_test_runs=self.test_runs / n,
+        total_reflections=self.reflections,
+        total_parse_errors=self.parse_errors,
+    )
+
+
 def compute_metrics(results: List[TaskResult]) -> EvalMetrics:
   """Compute aggregate metrics from a list of task results.
 
@@ -68,114 +128,21 @@ def compute_metrics(results: List[TaskResult]) -> EvalMetrics:
   if not results:
     return EvalMetrics()
 
-  metrics = EvalMetrics(total_tasks=len(results))
-
-  total_steps = 0
-  total_tool_calls = 0
-  total_duration = 0.0
-  total_reflections = 0
-  total_parse_errors = 0
-  total_test_runs = 0
-
-  # Group by category for per-category metrics
-  by_category: Dict[str, List[TaskResult]] = {}
+  totals = _Counts()
+  # Per-category counters, filled in the same pass (no per-category result lists)
+  by_category: Dict[str, _Counts] = {}
 
   for r in results:
-    # Count outcomes
-    if r.error:
-      metrics.errored += 1
-    elif r.success is True:
-      metrics.passed += 1
-    elif r.success is False:
-      metrics.failed += 1
-    else:
-      metrics.no_tests += 1
-
-    # Accumulate for averages
-    total_steps += r.steps
-    total_tool_calls += r.tool_calls
-    total_duration += r.duration_s
-    total_reflections += r.reflection_count
-    total_parse_errors += r.parse_errors
-    total_test_runs += r.test_runs
-
-    # Group by category
+    totals.add(r)
     category = r.metadata.get("category", "uncategorized")
-    if category not in by_category:
-      by_category[category] = []
-    by_category[category].append(r)
-
-  # Compute averages
-  n = len(results)
-  metrics.avg_steps = total_steps / n
-  metrics.avg_tool_calls = total_tool_calls / n
-  metrics.avg_duration_s = total_duration / n
-  metrics.total_duration_s = total_duration
-  metrics.avg_reflections = total_reflections / n
-  metrics.avg_parse_errors = total_parse_errors / n
-  metrics.avg_test_runs = total_test_runs / n
-  metrics.total_reflections = total_reflections
-  metrics.total_parse_errors = total_parse_errors
-
-  # Compute success rate (excluding errored and no_tests)
-  tested = metrics.passed + metrics.failed
-  if tested > 0:
-    metrics.success_rate = metrics.passed / tested
-
-  # Compute per-category metrics (non-recursive to avoid infinite nesting)
-  for category, cat_results in by_category.items():
-    cat_metrics = _compute_flat_metrics(cat_results)
-    metrics.by_category[category] = cat_metrics
-
-  return metrics
-
-
-def _compute_flat_metrics(results: List[TaskResult]) -> EvalMetrics:
-  """Compute metrics without recursive by_category breakdown."""
-  if not results:
-    return EvalMetrics()
-
-  metrics = EvalMetrics(total_tasks=len(results))
-
-  total_steps = 0
-  total_tool_calls = 0
-  total_duration = 0.0
-  total_reflections = 0
-  total_parse_errors = 0
-  total_test_runs = 0
-
-  for r in results:
-    if r.error:
-      metrics.errored += 1
-    elif r.success is True:
-      metrics.passed += 1
-    elif r.success is False:
-      metrics.failed += 1
-    else:
-      metrics.no_tests += 1
-
-    total_steps += r.steps
-    total_tool_calls += r.tool_calls
-    total_duration += r.duration_s
-    total_reflections += r.reflection_count
-    total_parse_errors += r.parse_errors
-    total_test_runs += r.test_runs
-
-  n = len(results)
-  metrics.avg_steps = total_steps / n
-  metrics.avg_tool_calls = total_tool_calls / n
-  metrics.avg_duration_s = total_duration / n
-  metrics.total_duration_s = total_duration
-  metrics.avg_reflections = total_reflections / n
-  metrics.avg_parse_errors = total_parse_errors / n
-  metrics.avg_test_runs = total_test_runs / n
-  metrics.total_reflections = total_reflections
-  metrics.total_parse_errors = total_parse_errors
-
-  tested = metrics.passed + metrics.failed
-  if tested > 0:
-    metrics.success_rate = metrics.passed / tested
-
+    counts = by_category.get(category)
+    if counts is None:
+      counts = by_category[category] = _Counts()
+    counts.add(r)
+
+  metrics = totals.to_metrics()
+  # Per-category metrics are flat (no nested by_category)
+  metrics.by_category = {category: counts.to_metrics() for category, counts in by_category.items()}
   return metrics
 
 
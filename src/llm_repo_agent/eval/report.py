@@ -6,11 +6,21 @@ import json
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from .runner import TaskResult
 from .metrics import EvalMetrics, compute_metrics
 
+MSGPACK_SUFFIX = ".msgpack"
+
+
+def _require_msgpack():
+  try:
+    import msgpack
+  except ImportError as e:
+    raise ImportError("Reading or writing .msgpack reports requires the 'msgpack' package.") from e
+  return msgpack
+
 
 @dataclass
 class EvalReport:
@@ -20,14 +30,14 @@ class EvalReport:
         suite_name: Name of the evaluation suite.
         timestamp: ISO timestamp when the report was generated.
         metrics: Aggregate metrics.
-        results: Per-task results.
+        results: Per-task results (an immutable snapshot).
         config: Configuration used for the run.
     """
 
   suite_name: str
   timestamp: str
   metrics: EvalMetrics
-  results: List[TaskResult]
+  results: Sequence[TaskResult]
   config: Dict[str, Any]
 
   def to_dict(self) -> Dict[str, Any]:
@@ -62,7 +72,7 @@ def generate_report(
       suite_name=suite_name,
       timestamp=timestamp,
       metrics=metrics,
-      results=results,
+      results=tuple(results),
       config=config or {},
   )
 
@@ -74,37 +84,44 @@ def write_report(
 ) -> None:
   """Write an evaluation report to a JSON file.
 
+    Paths ending in ``.msgpack`` are written as MessagePack instead, which is
+    smaller and faster to reload for machine-to-machine use (requires the
+    optional ``msgpack`` package).
+
     Args:
         report: The EvalReport to write.
-        path: Path to the output JSON file.
-        pretty: Whether to format with indentation (default True).
+        path: Path to the output JSON (or .msgpack) file.
+        pretty: Whether to format with indentation (default True, JSON only).
     """
   path = Path(path).expanduser().resolve()
   path.parent.mkdir(parents=True, exist_ok=True)
 
-  with path.open("w", encoding="utf-8") as f:
-    if pretty:
-      json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
-    else:
-      json.dump(report.to_dict(), f, ensure_ascii=False)
-    f.write("\n")
+  if path.suffix == MSGPACK_SUFFIX:
+    path.write_bytes(_require_msgpack().packb(report.to_dict(), use_bin_type=True))
+    return
+
+  text = json.dumps(report.to_dict(), indent=2 if pretty else None, ensure_ascii=False)
+  path.write_bytes((text + "\n").encode("utf-8"))
 
 
 def load_report(path: Path) -> EvalReport:
-  """Load an evaluation report from a JSON file.
+  """Load an evaluation report from a JSON (or .msgpack) file.
 
     Args:
-        path: Path to the report JSON file.
+        path: Path to the report file.
 
     Returns:
         EvalReport reconstructed from the file.
     """
   path = Path(path).expanduser().resolve()
-  with path.open("r", encoding="utf-8") as f:
-    data = json.load(f)
+  if path.suffix == MSGPACK_SUFFIX:
+    data = _require_msgpack().unpackb(path.read_bytes(), raw=False)
+  else:
+    with path.open("r", encoding="utf-8") as f:
+      data = json.load(f)
 
   # Reconstruct TaskResult objects
-  results = [TaskResult(**r) for r in data.get("results", [])]
+  results = tuple(TaskResult(**r) for r in data.get("results", []))
 
   # Reconstruct EvalMetrics (simplified - by_category as dicts)
   metrics_data = data.get("metrics", {})
@@ -127,6 +127,7 @@ class EvalRunner:
 
     repo_root = Path(task.repo).expanduser().resolve()
     sandbox: Optional[Sandbox] = None
+    trace: Optional[Trace] = None
     tools_root = repo_root
 
     try:
@@ -192,6 +193,8 @@ class EvalRunner:
       task_result.success = False
 
     finally:
+      if trace is not None:
+        trace.close()
       # Cleanup sandbox
       if sandbox and not self.cfg.keep_sandbox:
         cleanup_sandbox(sandbox)
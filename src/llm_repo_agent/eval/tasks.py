@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import json
+from collections import ChainMap
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
 
+from llm_repo_agent import fastjson
 
-@dataclass
+JSONL_SUFFIX = ".jsonl"
+
+
+@dataclass(slots=True)
 class TaskSpec:
   """Specification for a single evaluation task.
 
@@ -36,7 +41,7 @@ class TaskSpec:
     return asdict(self)
 
   @classmethod
-  def from_dict(cls, d: Dict[str, Any]) -> "TaskSpec":
+  def from_dict(cls, d: Mapping[str, Any]) -> "TaskSpec":
     return cls(
         task_id=d["task_id"],
         repo=d["repo"],
@@ -46,7 +51,7 @@ class TaskSpec:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalSuite:
   """A collection of tasks to evaluate.
 
@@ -73,19 +78,21 @@ class EvalSuite:
   @classmethod
   def from_dict(cls, d: Dict[str, Any]) -> "EvalSuite":
     defaults = d.get("defaults", {})
-    tasks = []
-    for t in d.get("tasks", []):
-      # Apply defaults to each task
-      task_data = {**defaults, **t}
-      tasks.append(TaskSpec.from_dict(task_data))
     return cls(
         name=d.get("name", "unnamed"),
         description=d.get("description", ""),
         defaults=defaults,
-        tasks=tasks,
+        tasks=list(_iter_tasks(d.get("tasks", []), defaults)),
     )
 
 
+def _iter_tasks(task_dicts: Iterable[Dict[str, Any]], defaults: Dict[str, Any]) -> Iterator[TaskSpec]:
+  """Yield TaskSpecs with suite defaults applied (task values win)."""
+  for t in task_dicts:
+    # Layered lookup instead of a merged copy; from_dict only reads a few keys
+    yield TaskSpec.from_dict(ChainMap(t, defaults))
+
+
 def load_suite(path: Path) -> EvalSuite:
   """Load an evaluation suite from a JSON file.
 
@@ -106,16 +113,41 @@ def load_suite(path: Path) -> EvalSuite:
             ...
         ]
     }
+
+    Paths ending in ``.jsonl`` are read as JSON Lines instead: the first line is
+    a header object with name/description/defaults, and every following line is
+    one task object. Tasks are parsed one line at a time.
     """
   path = Path(path).expanduser().resolve()
-  with path.open("r", encoding="utf-8") as f:
-    data = json.load(f)
+  if path.suffix == JSONL_SUFFIX:
+    return _load_suite_jsonl(path)
+  data = fastjson.loads(path.read_bytes())
   return EvalSuite.from_dict(data)
 
 
+def _load_suite_jsonl(path: Path) -> EvalSuite:
+  with path.open("rb") as f:
+    records = (fastjson.loads(line) for line in f if line.strip())
+    header = next(records, {})
+    defaults = header.get("defaults", {})
+    return EvalSuite(
+        name=header.get("name", "unnamed"),
+        description=header.get("description", ""),
+        defaults=defaults,
+        tasks=list(_iter_tasks(records, defaults)),
+    )
+
+
 def save_suite(suite: EvalSuite, path: Path) -> None:
-  """Save an evaluation suite to a JSON file."""
+  """Save an evaluation suite to a JSON file (JSON Lines if the path ends in .jsonl)."""
   path = Path(path).expanduser().resolve()
   path.parent.mkdir(parents=True, exist_ok=True)
+  if path.suffix == JSONL_SUFFIX:
+    with path.open("wb") as f:
+      header = {"name": suite.name, "description": suite.description, "defaults": suite.defaults}
+      f.write(fastjson.dumps_line(header))
+      for t in suite.tasks:
+        f.write(fastjson.dumps_line(t.to_dict()))
+    return
   with path.open("w", encoding="utf-8") as f:
     json.dump(suite.to_dict(), f, indent=2)
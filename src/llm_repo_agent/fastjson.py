@@ -0,0 +1,46 @@
+"""JSON helpers backed by orjson when it is installed, stdlib json otherwise.
+
+Only used for machine-readable artifacts (trace JSONL, suite files). Human-facing
+output (pretty-printed payloads, reports) keeps using stdlib json formatting.
+
+orjson is stricter than stdlib json: it refuses integers wider than 64 bits and
+nesting deeper than 254 levels, rejects NaN/Infinity literals, and reads wide
+integers back as floats. Those inputs fall back to stdlib json so both backends
+accept and produce the same documents.
+"""
+
+from __future__ import annotations
+import json
+import re
+from typing import Any, Union
+
+try:
+  import orjson
+except Exception:
+  orjson = None
+
+# orjson turns integers past the u64 range into floats; any such literal has 20+ digits.
+_WIDE_INT = re.compile(rb"[0-9]{20}")
+_WIDE_INT_STR = re.compile("[0-9]{20}")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+  """Parse a JSON document from bytes or str."""
+  if orjson is not None:
+    wide = _WIDE_INT_STR if isinstance(data, str) else _WIDE_INT
+    if not wide.search(data):
+      try:
+        return orjson.loads(data)
+      except orjson.JSONDecodeError:
+        pass
+  return json.loads(data)
+
+
+def dumps_line(obj: Any) -> bytes:
+  """Serialize obj as one compact UTF-8 JSON line terminated by a newline."""
+  if orjson is not None:
+    try:
+      return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+      pass
+  return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
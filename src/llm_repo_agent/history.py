@@ -1,16 +1,19 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 
 class HistoryEvent:
+  __slots__ = ()
   kind: str
 
   def to_dict(self) -> Dict[str, Any]:
     raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEvent(HistoryEvent):
   name: str
   args: Dict[str, Any]
@@ -20,7 +23,7 @@ class ToolCallEvent(HistoryEvent):
     return {"kind": self.kind, "name": self.name, "args": self.args}
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
   ok: bool
   output: str
@@ -38,7 +41,7 @@ class Observation:
     return cls(ok=bool(getattr(res, "ok", False)), output=output, meta=meta)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationEvent(HistoryEvent):
   tool: str
   observation: Observation
@@ -48,7 +51,7 @@ class ObservationEvent(HistoryEvent):
     return {"kind": self.kind, "tool": self.tool, "obs": self.observation.to_dict()}
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMActionEvent(HistoryEvent):
   obj: Dict[str, Any]
   kind: str = field(init=False, default="llm_action")
@@ -57,7 +60,7 @@ class LLMActionEvent(HistoryEvent):
     return {"kind": self.kind, "obj": self.obj}
 
 
-@dataclass
+@dataclass(slots=True)
 class DriverNoteEvent(HistoryEvent):
   note: str
   kind: str = field(init=False, default="driver_note")
@@ -66,7 +69,7 @@ class DriverNoteEvent(HistoryEvent):
     return {"kind": self.kind, "note": self.note}
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionEvent(HistoryEvent):
   notes: List[str]
   next_focus: Optional[str]
@@ -82,12 +85,32 @@ class ReflectionEvent(HistoryEvent):
     }
 
 
+def _reflection_keys(event: ReflectionEvent) -> FrozenSet[str]:
+  """Normalized notes/next_focus/risks of a reflection, as used for dedup."""
+  keys = {n.strip().lower() for n in event.notes or []}
+  if isinstance(event.next_focus, str):
+    keys.add(event.next_focus.strip().lower())
+  keys.update(r.strip().lower() for r in event.risks or [] if isinstance(r, str))
+  return frozenset(keys)
+
+
 class History:
   def __init__(self):
     self.events: List[HistoryEvent] = []
+    # Reflections currently in self.events, oldest first, with their dedup keys
+    self._reflections: Deque[Tuple[ReflectionEvent, FrozenSet[str]]] = deque()
+    # Maintained on append so touched_files()/detect_loop() don't rescan events
+    self._tool_call_names: List[str] = []
+    self._touched: Dict[str, None] = {}
 
   def _append(self, event: HistoryEvent) -> None:
     self.events.append(event)
+    if isinstance(event, ToolCallEvent):
+      self._tool_call_names.append(event.name)
+    elif isinstance(event, ObservationEvent) and event.tool == "write_file":
+      rel = event.observation.meta.get("rel_path") or event.observation.meta.get("path")
+      if isinstance(rel, str):
+        self._touched.setdefault(rel)
 
   def append_tool_call(self, event: ToolCallEvent) -> None:
     self._append(event)
@@ -108,18 +131,10 @@ class History:
     dedup_window = dedup_window or 0
 
     # Deduplicate against recent reflection notes
-    recent_reflections = [e for e in self.events if isinstance(e, ReflectionEvent)]
-    recent_slice = recent_reflections[-dedup_window:] if dedup_window > 0 else recent_reflections
+    skip = max(0, len(self._reflections) - dedup_window) if dedup_window > 0 else 0
     seen = set()
-    for ref in recent_slice:
-      for n in ref.notes or []:
-        seen.add(n.strip().lower())
-      nf = ref.next_focus
-      if isinstance(nf, str):
-        seen.add(nf.strip().lower())
-      for r in ref.risks or []:
-        if isinstance(r, str):
-          seen.add(r.strip().lower())
+    for _, keys in islice(self._reflections, skip, None):
+      seen |= keys
 
     deduped_notes: List[str] = []
     for n in event.notes:
@@ -151,31 +166,25 @@ class History:
         risks=deduped_risks,
     )
     self._append(deduped_event)
+    self._reflections.append((deduped_event, _reflection_keys(deduped_event)))
 
-    # Cap reflections to last max_reflections
+    # Cap reflections to last max_reflections, evicting the oldest by identity
     if max_reflections and max_reflections > 0:
-      reflection_indices = [i for i, e in enumerate(self.events) if isinstance(e, ReflectionEvent)]
-      overflow = len(reflection_indices) - max_reflections
-      while overflow > 0 and reflection_indices:
-        idx = reflection_indices.pop(0)
-        self.events.pop(idx)
-        reflection_indices = [i - 1 if i > idx else i for i in reflection_indices]
-        overflow -= 1
+      while len(self._reflections) > max_reflections:
+        oldest, _ = self._reflections.popleft()
+        for i, e in enumerate(self.events):
+          if e is oldest:
+            del self.events[i]
+            break
+
+  def recent_reflections(self, k: int = 0) -> List[ReflectionEvent]:
+    """Return the last k reflections still in history (all of them if k <= 0), oldest first."""
+    skip = max(0, len(self._reflections) - k) if k > 0 else 0
+    return [ref for ref, _ in islice(self._reflections, skip, None)]
 
   def touched_files(self) -> List[str]:
     """Return unique file paths touched by write_file observations in order."""
-    seen = set()
-    files: List[str] = []
-    for e in self.events:
-      if not isinstance(e, ObservationEvent):
-        continue
-      if e.tool != "write_file":
-        continue
-      rel = e.observation.meta.get("rel_path") or e.observation.meta.get("path")
-      if isinstance(rel, str) and rel not in seen:
-        seen.add(rel)
-        files.append(rel)
-    return files
+    return list(self._touched)
 
   def last_n(self, n: int) -> List[Dict[str, Any]]:
     if n <= 0:
@@ -186,12 +195,10 @@ class History:
     return any(isinstance(e, ObservationEvent) for e in self.events)
 
   def detect_loop(self, k: int) -> bool:
-    tool_calls = [e for e in self.events if isinstance(e, ToolCallEvent)]
-    if len(tool_calls) < k:
+    names = self._tool_call_names
+    if len(names) < k:
       return False
-    last = tool_calls[-k:]
-    names = [x.name for x in last]
-    return len(set(names)) == 1
+    return len(set(names[-k:])) == 1
 
   def to_prompt_list(self, max_history: int) -> List[Dict[str, Any]]:
     return self.last_n(max_history)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 import argparse
 import json
+import sys
 import time
 from pathlib import Path
 from typing import Iterable
 
 from .trace import Trace
 
+# Every line boundary str.splitlines() recognises, plus tabs, becomes a single
+# space when a prompt is printed on one line
+_WS_FLATTEN = str.maketrans({
+    c: " " for c in "\n\r\t\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+})
+
+
+def _flatten_text(s: str) -> str:
+  return s.replace("\r\n", "\n").translate(_WS_FLATTEN)
+
 
 def format_ts(ts: float) -> str:
   try:
@@ -16,6 +27,8 @@ def format_ts(ts: float) -> str:
 
 
 def pretty_print_events(events: Iterable[dict], max_payload_len: int = 1200, full: bool = False) -> None:
+  # Collect the whole listing and write it once instead of one print() per event
+  parts = []
   for i, evt in enumerate(events, start=1):
     ts = evt.get("ts")
     kind = evt.get("kind")
@@ -43,7 +56,142 @@ def pretty_print_events(events: Iterable[dict], max_payload_len: int = 1200, ful
           msg_lines.append(f"- role: {role}\n  content:\n{content}\n")
         payload_s = "\n".join(msg_lines)
 
-    print(f"{i:3d}. {ts_s} [{kind}] (run={run_id})\n    {payload_s}\n")
+    parts.append(f"{i:3d}. {ts_s} [{kind}] (run={run_id})\n    {payload_s}\n\n")
+
+  sys.stdout.write("".join(parts))
+
+
+def _compose_prompt_text(evt: dict, full: bool) -> str:
+  payload = evt.get("payload", {})
+  msgs = payload.get("messages") or []
+  parts = []
+  for m in msgs:
+    role = m.get("role", "")
+    content = m.get("content", "")
+    if not full and len(content) > 800:
+      content = content[:800] + "..."
+    parts.append(f"{role}: {content}")
+  return "\n\n".join(parts)
+
+
+def _summarize_event(evt: dict) -> str:
+  """One-line summary of a history event for --prompt-with-history."""
+  kind = evt.get("kind")
+  payload = evt.get("payload", {})
+  if kind == "llm_request":
+    s = _compose_prompt_text(evt, full=False)
+  elif kind == "tool_call":
+    name = payload.get("name") or payload.get("tool") or "tool_call"
+    tool_args = payload.get("args") or payload.get("kwargs") or {}
+    s = f"tool_call {name} {json.dumps(tool_args, ensure_ascii=False)}"
+  elif kind == "tool_result":
+    # Pick human-friendly fields if present
+    summary = payload.get("summary") or payload.get("output") or json.dumps(payload, ensure_ascii=False)
+    s = f"tool_result {summary}"
+  else:
+    s = json.dumps(payload, ensure_ascii=False)
+  # flatten to one line and truncate
+  one = _flatten_text(s).rstrip()
+  if len(one) > 300:
+    one = one[:300] + "..."
+  return one
+
+
+# Mode handlers all take (args, events, run_events): `events` is the filtered
+# selection, `run_events` the full run loaded once by main().
+
+def _handle_dump_prompt(args, events, run_events) -> int:
+  # Requires a single llm_request event (index)
+  if args.kind != "llm_request":
+    print("Error: --dump-prompt requires --kind llm_request and --index")
+    return 2
+  if args.index is None:
+    print("Error: --dump-prompt requires --index to select a single event")
+    return 2
+  prompt_text = _compose_prompt_text(events[0], full=args.full)
+  dump_path = Path(args.dump_prompt)
+  dump_path.write_text(prompt_text)
+  print(f"Wrote prompt to {dump_path}")
+  return 0
+
+
+def _handle_pretty_only_prompt(args, events, run_events) -> int:
+  # Print only the prompt text (no header / metadata)
+  if not all(e.get("kind") == "llm_request" for e in events):
+    print("Error: --pretty-only-prompt only makes sense when filtering llm_request events")
+    return 2
+  for evt in events:
+    print(_compose_prompt_text(evt, full=args.full))
+  return 0
+
+
+def _handle_prompt_with_history(args, events, run_events) -> int:
+  # Print a one-line prompt (no newlines) together with surrounding history
+  if args.kind != "llm_request":
+    print("Error: --prompt-with-history requires --kind llm_request and --index")
+    return 2
+  if args.index is None:
+    print("Error: --prompt-with-history requires --index to select a single event")
+    return 2
+
+  # Locate the selected (filtered) event in the full run to get surrounding history
+  sel_evt = events[0]
+  sel_idx = None
+  for i, ev in enumerate(run_events):
+    if ev == sel_evt:
+      sel_idx = i
+      break
+  if sel_idx is None:
+    print("Error: Selected event not found in run history")
+    return 2
+
+  # History window
+  w = max(0, args.history_window)
+  start = max(0, sel_idx - w)
+  end = min(len(run_events), sel_idx + w + 1)
+  history = run_events[start:end]
+
+  prompt_text = _compose_prompt_text(sel_evt, full=args.full)
+  if args.preserve_newlines:
+    # Print multi-line prompt block with indentation for readability
+    print("PROMPT:")
+    for line in prompt_text.splitlines():
+      print(f"  {line}")
+    print()
+  else:
+    print(f"PROMPT: {_flatten_text(prompt_text).strip()}\n")
+
+  print(f"HISTORY (events {start}..{end - 1} around selected index {sel_idx}):")
+  for i, he in enumerate(history, start=start):
+    ts_s = format_ts(he.get("ts")) if he.get("ts") else "-"
+    print(f" - {i}: {ts_s} [{he.get('kind')}] {_summarize_event(he)}")
+  return 0
+
+
+def _handle_events(args, events, run_events) -> int:
+  # Emit summary header
+  print(f"Trace file: {Path(args.trace)}\nRun id: {args.run_id}\n")
+  pretty_print_events(events, full=args.full)
+  return 0
+
+
+_MODE_HANDLERS = {
+    "dump_prompt": _handle_dump_prompt,
+    "pretty_only_prompt": _handle_pretty_only_prompt,
+    "prompt_with_history": _handle_prompt_with_history,
+    "events": _handle_events,
+}
+
+
+def _resolve_mode(args) -> str:
+  """Pick the output mode; earlier flags win when several are given."""
+  if args.dump_prompt:
+    return "dump_prompt"
+  if args.pretty_only_prompt:
+    return "pretty_only_prompt"
+  if args.prompt_with_history:
+    return "prompt_with_history"
+  return "events"
 
 
 def main(argv=None) -> int:
@@ -68,7 +216,9 @@ def main(argv=None) -> int:
 
   trace = Trace(trace_path, run_id=args.run_id)
 
-  events = list(trace.iter_run_events(args.run_id))
+  # Load the run once; later modes slice this list instead of re-reading the file
+  run_events = list(trace.iter_run_events(args.run_id))
+  events = run_events
   if not events:
     print("No events found for run_id")
     return 0
@@ -90,126 +240,7 @@ def main(argv=None) -> int:
   if args.max and args.max > 0:
     events = events[: args.max]
 
-  def _compose_prompt_text(evt: dict, full: bool) -> str:
-    payload = evt.get("payload", {})
-    msgs = payload.get("messages") or []
-    parts = []
-    for m in msgs:
-      role = m.get("role", "")
-      content = m.get("content", "")
-      if not full and len(content) > 800:
-        content = content[:800] + "..."
-      parts.append(f"{role}: {content}")
-    return "\n\n".join(parts)
-
-  # Handle dump-prompt: requires a single llm_request event (index)
-  if args.dump_prompt:
-    if args.kind != "llm_request":
-      print("Error: --dump-prompt requires --kind llm_request and --index")
-      return 2
-    if args.index is None:
-      print("Error: --dump-prompt requires --index to select a single event")
-      return 2
-    evt = events[0]
-    prompt_text = _compose_prompt_text(evt, full=args.full)
-    dump_path = Path(args.dump_prompt)
-    dump_path.write_text(prompt_text)
-    print(f"Wrote prompt to {dump_path}")
-    return 0
-
-  # If we only want the prompt text, print only it (no header / metadata)
-  if args.pretty_only_prompt:
-    only_llm = all(e.get("kind") == "llm_request" for e in events)
-    if not only_llm:
-      print("Error: --pretty-only-prompt only makes sense when filtering llm_request events")
-      return 2
-    for evt in events:
-      prompt_text = _compose_prompt_text(evt, full=args.full)
-      print(prompt_text)
-    return 0
-
-  # Print a one-line prompt (no newlines) together with surrounding history
-  if args.prompt_with_history:
-    if args.kind != "llm_request":
-      print("Error: --prompt-with-history requires --kind llm_request and --index")
-      return 2
-    if args.index is None:
-      print("Error: --prompt-with-history requires --index to select a single event")
-      return 2
-
-    # We need the full event list to get surrounding history
-    all_events = list(trace.iter_run_events(args.run_id))
-    # Selected event (from filtered events)
-    sel_evt = events[0]
-    # Find index in all_events
-    sel_idx = None
-    for i, ev in enumerate(all_events):
-      if ev == sel_evt:
-        sel_idx = i
-        break
-    if sel_idx is None:
-      print("Error: Selected event not found in run history")
-      return 2
-
-    # Compose flattened prompt (one-line)
-    def _flatten_text(s: str) -> str:
-      return " ".join(s.splitlines()).replace("\t", " ").strip()
-
-    prompt_text = _compose_prompt_text(sel_evt, full=args.full)
-    flat_prompt = _flatten_text(prompt_text)
-
-    # History window
-    w = max(0, args.history_window)
-    start = max(0, sel_idx - w)
-    end = min(len(all_events), sel_idx + w + 1)
-    history = all_events[start:end]
-
-    # Helper to make one-line summaries for history events
-    def _summarize_event(evt: dict) -> str:
-      kind = evt.get("kind")
-      payload = evt.get("payload", {})
-      if kind == "llm_request":
-        s = _compose_prompt_text(evt, full=False)
-      elif kind == "tool_call":
-        name = payload.get("name") or payload.get("tool") or "tool_call"
-        args = payload.get("args") or payload.get("kwargs") or {}
-        s = f"tool_call {name} {json.dumps(args, ensure_ascii=False)}"
-      elif kind == "tool_result":
-        # Pick human-friendly fields if present
-        summary = payload.get("summary") or payload.get("output") or json.dumps(payload, ensure_ascii=False)
-        s = f"tool_result {summary}"
-      else:
-        s = json.dumps(payload, ensure_ascii=False)
-      # flatten to one line and truncate
-      one = " ".join(s.splitlines())
-      if len(one) > 300:
-        one = one[:300] + "..."
-      return one.replace("\t", " ")
-
-    # Print prompt and history
-    if args.preserve_newlines:
-      # Print multi-line prompt block with indentation for readability
-      prompt_text_block = _compose_prompt_text(sel_evt, full=args.full)
-      print("PROMPT:")
-      for line in prompt_text_block.splitlines():
-        print(f"  {line}")
-      print()
-    else:
-      print(f"PROMPT: {flat_prompt}\n")
-
-    print(f"HISTORY (events {start}..{end - 1} around selected index {sel_idx}):")
-    for i, he in enumerate(history, start=start):
-      ts_s = format_ts(he.get("ts")) if he.get("ts") else "-"
-      summary = _summarize_event(he)
-      print(f" - {i}: {ts_s} [{he.get('kind')}] {summary}")
-
-    return 0
-
-  # Emit summary header
-  print(f"Trace file: {trace_path}\nRun id: {args.run_id}\n")
-
-  pretty_print_events(events, full=args.full)
-  return 0
+  return _MODE_HANDLERS[_resolve_mode(args)](args, events, run_events)
 
 
 if __name__ == "__main__":
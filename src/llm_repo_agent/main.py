@@ -58,6 +58,7 @@ def cmd_run(args):
   try:
     out = agent.run(goal=args.goal, test_cmd=test_cmd)
   finally:
+    trace.close()
     if sandbox and not args.keep_sandbox:
       sandbox_module.cleanup_sandbox(sandbox)
       print(f"[sandbox] cleaned up {sandbox.root}")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from .tool_schema import PROMPT_TOOL_SPEC, ALLOWED_TOOL_NAMES_TEXT
 
 
+# The prompt depends only on module constants; build it (and dump the tool spec) once
+@lru_cache(maxsize=None)
 def system_prompt() -> str:
   return (
     "You are a repo-fixing agent.\n"
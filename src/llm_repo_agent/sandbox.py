@@ -1,9 +1,23 @@
 from __future__ import annotations
+import errno
+import os
 import shutil
+import stat
+import sys
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+  import fcntl
+except ImportError:  # not available on Windows
+  fcntl = None
+
+# FICLONE from linux/fs.h: share src's extents with dst (copy-on-write)
+_FICLONE = 0x40049409
+# Errors meaning "this filesystem / pair of filesystems cannot clone"
+_NO_CLONE_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS})
 
 
 @dataclass(frozen=True)
@@ -11,6 +25,36 @@ class Sandbox:
   root: Path
 
 
+def _make_copy_function() -> Callable[[str, str], str]:
+  """Return a copytree copy_function that reflinks files when it can.
+
+  On Linux filesystems with reflink support (Btrfs, XFS, bcachefs, ...) each file is
+  cloned with FICLONE, so the sandbox shares blocks with the source until written.
+  After the first "cannot clone" error the function falls back to shutil.copy2
+  for the rest of the tree. Non-regular files (FIFOs, devices, ...) always go
+  straight to copy2, which rejects them instead of blocking on open().
+  """
+  can_clone = fcntl is not None and sys.platform.startswith("linux")
+
+  def copy(src: str, dst: str) -> str:
+    nonlocal can_clone
+    if can_clone and stat.S_ISREG(os.stat(src).st_mode):
+      try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+          fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+      except OSError as e:
+        if e.errno in _NO_CLONE_ERRNOS:
+          can_clone = False
+        # Any other error (EACCES, ...) is specific to this file: fall through to
+        # copy2, which retries it and raises the error copytree would have reported.
+      else:
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+  return copy
+
+
 def materialize_repo_sandbox(src: Path, dest: Optional[Path] = None) -> Sandbox:
   """Create a writable sandbox copy of the repo.
 
@@ -25,7 +69,7 @@ def materialize_repo_sandbox(src: Path, dest: Optional[Path] = None) -> Sandbox:
       raise ValueError(f"sandbox destination is not empty: {dest}")
     dest.mkdir(parents=True, exist_ok=True)
 
-  shutil.copytree(src, dest, dirs_exist_ok=True)
+  shutil.copytree(src, dest, copy_function=_make_copy_function(), dirs_exist_ok=True)
   return Sandbox(root=dest)
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
-import json
+import io
 import time
 from dataclasses import dataclass, asdict, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import fastjson
 
 
 @dataclass
@@ -109,12 +111,36 @@ class FinalPayload(TracePayload):
   final: Dict[str, Any]
 
 
+ZSTD_SUFFIX = ".zst"
+
+
+def _require_zstd():
+  try:
+    import zstandard
+  except ImportError as e:
+    raise ImportError("Reading or writing .zst traces requires the 'zstandard' package.") from e
+  return zstandard
+
+
+# Event kinds get_run_history reconstructs; everything else can be skipped unparsed
+_HISTORY_KINDS = frozenset({"llm_action", "tool_result", "tests"})
+
+
+def _quoted_needle(value: str) -> Optional[bytes]:
+  """The JSON string bytes for value, if every serializer writes it verbatim."""
+  if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+    return f'"{value}"'.encode("ascii")
+  return None
+
+
 class Trace:
 
   def __init__(self, path: Path, run_id: str, meta: Optional[Dict[str, Any]] = None):
     self.path = path
     self.run_id = run_id
     self.meta = meta or {}
+    self._fh = None
+    self._zctx = None
     self.path.parent.mkdir(parents=True, exist_ok=True)
 
   def _payload_to_dict(self, payload: Any) -> Dict[str, Any]:
@@ -131,29 +157,90 @@ class Trace:
   def log(self, kind: str, payload: Any) -> None:
     payload_dict = self._payload_to_dict(payload)
     evt = TraceEvent(ts=time.time(), kind=kind, payload=payload_dict, run_id=self.run_id, meta=self.meta)
-    with self.path.open("a", encoding="utf-8") as f:
-      f.write(json.dumps(asdict(evt), ensure_ascii=False) + "\n")
+    if self._fh is None:
+      self._fh = self._open_append()
+    data = fastjson.dumps_line(asdict(evt))
+    if self._zctx is not None:
+      data = self._zctx.compress(data)
+    self._fh.write(data)
+    # Flush per event so readers of the same file (history, metrics) see every line.
+    self._fh.flush()
+
+  def _open_append(self):
+    if self.path.suffix == ZSTD_SUFFIX:
+      # Each event is written as its own complete zstd frame, so the file is
+      # always a valid frame sequence: readers decode everything logged so far,
+      # and a later writer (or one in another process) can simply append.
+      # There is no locking: concurrent writers rely on each event being a
+      # single O_APPEND write, which local filesystems keep whole.
+      self._zctx = _require_zstd().ZstdCompressor(level=3)
+    return self.path.open("ab")
+
+  def close(self) -> None:
+    """Close the append handle; a later log() reopens it."""
+    if self._fh is not None:
+      self._fh.close()
+      self._fh = None
+
+  def __enter__(self) -> "Trace":
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.close()
+
+  def __del__(self) -> None:
+    self.close()
 
   # Helpers to iterate and reconstruct a run's events/history
-  def iter_all_events(self):
-    """Yield raw event dicts from the trace file in order."""
+  def _iter_lines(self):
     if not self.path.exists():
       return
-    with self.path.open("r", encoding="utf-8") as f:
-      for line in f:
-        line = line.strip()
-        if not line:
-          continue
-        try:
-          yield json.loads(line)
-        except Exception:
-          # skip malformed lines
-          continue
-
-  def iter_run_events(self, run_id: str):
-    """Yield events that match a run_id in chronological order."""
-    for evt in self.iter_all_events():
-      if evt.get("run_id") == run_id:
+    # Read raw bytes: the JSON parser decodes UTF-8 itself, so skip the text layer
+    with self.path.open("rb") as f:
+      stop_on = ()
+      if self.path.suffix == ZSTD_SUFFIX:
+        zstd = _require_zstd()
+        stop_on = zstd.ZstdError
+        f = io.BufferedReader(zstd.ZstdDecompressor().stream_reader(f, read_across_frames=True))
+      try:
+        for line in f:
+          line = line.strip()
+          if line:
+            yield line
+      except stop_on:
+        # Corrupt compressed data: keep what decoded cleanly, like malformed JSON lines
+        return
+
+  def iter_all_events(self):
+    """Yield raw event dicts from the trace file in order."""
+    for line in self._iter_lines():
+      try:
+        yield fastjson.loads(line)
+      except Exception:
+        # skip malformed lines
+        continue
+
+  def iter_run_events(self, run_id: str, kinds: Optional[Iterable[str]] = None):
+    """Yield events that match a run_id (and, if given, one of `kinds`) in chronological order."""
+    # Plain ASCII ids/kinds are serialized verbatim, so lines that don't contain
+    # them quoted can be skipped without parsing. Matches are still checked below.
+    needle = _quoted_needle(run_id)
+    kinds = frozenset(kinds) if kinds is not None else None
+    kind_needles = None
+    if kinds is not None:
+      kind_needles = tuple(_quoted_needle(k) for k in kinds)
+      if None in kind_needles:
+        kind_needles = None
+    for line in self._iter_lines():
+      if needle is not None and needle not in line:
+        continue
+      if kind_needles is not None and not any(k in line for k in kind_needles):
+        continue
+      try:
+        evt = fastjson.loads(line)
+      except Exception:
+        continue
+      if evt.get("run_id") == run_id and (kinds is None or evt.get("kind") in kinds):
         yield evt
 
   def get_run_history(self, run_id: str):
@@ -162,7 +249,7 @@ class Trace:
     Returns a list of dicts like the in-memory history used by the agent.
     """
     history = []
-    for evt in self.iter_run_events(run_id):
+    for evt in self.iter_run_events(run_id, kinds=_HISTORY_KINDS):
       k = evt.get("kind")
       p = evt.get("payload", {})
       if k == "llm_action":
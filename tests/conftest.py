@@ -0,0 +1,43 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llm_repo_agent.agent import AgentConfig, RepoAgent
+from llm_repo_agent.tools import RepoTools
+from llm_repo_agent.trace import Trace
+
+
+@pytest.fixture
+def write_jsonl():
+    """Return a helper that writes a list of event dicts to a JSONL trace file."""
+    def _write(path, events):
+        with path.open("w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e) + "\n" for e in events)
+        return path
+    return _write
+
+
+@pytest.fixture
+def read_jsonl():
+    """Return a helper that parses every line of a JSONL file; a malformed line fails the test."""
+    def _read(path):
+        with open(path, "rb") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return _read
+
+
+@pytest.fixture
+def agent_env(tmp_path):
+    """Empty temp repo with RepoTools and a Trace, plus a RepoAgent builder."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    trace_path = tmp_path / "trace.jsonl"
+    tools = RepoTools(repo_root=repo_root)
+    trace = Trace(trace_path, run_id="r1")
+
+    def make_agent(llm, cfg=None):
+        return RepoAgent(llm=llm, tools=tools, trace=trace, cfg=cfg or AgentConfig())
+
+    yield SimpleNamespace(repo_root=repo_root, tools=tools, trace=trace, trace_path=trace_path, make_agent=make_agent)
+    trace.close()
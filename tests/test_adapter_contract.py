@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 from llm_repo_agent.agent import RepoAgent, AgentConfig
@@ -6,7 +5,7 @@ from llm_repo_agent.tools import RepoTools
 from llm_repo_agent.trace import Trace
 
 
-def test_agent_rejects_raw_dict_action(tmp_path):
+def test_agent_rejects_raw_dict_action(tmp_path, read_jsonl):
     # Dummy LLM that returns a raw dict (legacy behavior)
     class DummyLLM:
         def start_conversation(self, system_prompt, user_goal):
@@ -33,6 +32,5 @@ def test_agent_rejects_raw_dict_action(tmp_path):
         assert "must return a typed Action" in str(e)
 
     # Ensure we logged the parse error in the trace
-    lines = trace_file.read_text(encoding="utf-8").splitlines()
-    kinds = [json.loads(l)['kind'] for l in lines]
+    kinds = [e['kind'] for e in read_jsonl(trace_file)]
     assert 'llm_parse_error' in kinds
@@ -1,8 +1,11 @@
 """Tests for eval/report.py - generate_report, write/load_report, compare_reports."""
 
 import json
+import sys
 from pathlib import Path
 
+import pytest
+
 import llm_repo_agent.eval.report as eval_report
 import llm_repo_agent.eval.runner as eval_runner
 import llm_repo_agent.eval.metrics as eval_metrics
@@ -57,6 +60,17 @@ def test_generate_report_basic():
     assert report.timestamp  # Should have a timestamp
 
 
+def test_generate_report_snapshots_results():
+    """Test generate_report is unaffected by later mutation of the input list."""
+    results = [_make_result("t1", success=True)]
+    report = eval_report.generate_report("suite", results)
+
+    results.append(_make_result("t2", success=False))
+
+    assert len(report.results) == 1
+    assert report.to_dict()["results"][0]["task_id"] == "t1"
+
+
 def test_generate_report_no_config():
     """Test generate_report with no config provided."""
     results = [_make_result("t1", success=True)]
@@ -155,6 +169,31 @@ def test_load_report_with_categories(tmp_path):
     assert isinstance(loaded.metrics.by_category["easy"], eval_metrics.EvalMetrics)
 
 
+def test_load_report_msgpack(tmp_path):
+    """Test write/load_report round-trip through the .msgpack format."""
+    pytest.importorskip("msgpack")
+    results = [
+        _make_result("t1", success=True, steps=5, metadata={"category": "easy"}),
+        _make_result("t2", success=False, steps=3),
+    ]
+    original = eval_report.generate_report("packed_suite", results, {"model": "test"})
+
+    path = tmp_path / "report.msgpack"
+    eval_report.write_report(original, path)
+    loaded = eval_report.load_report(path)
+
+    assert loaded.to_dict() == original.to_dict()
+
+
+def test_write_report_msgpack_requires_package(tmp_path, monkeypatch):
+    """Test a clear ImportError is raised when msgpack is not installed."""
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    report = eval_report.generate_report("suite", [_make_result("t1", success=True)])
+
+    with pytest.raises(ImportError, match="msgpack"):
+        eval_report.write_report(report, tmp_path / "report.msgpack")
+
+
 def test_roundtrip_report(tmp_path):
     """Test write then load preserves report data."""
     results = [
@@ -232,3 +232,43 @@ def test_roundtrip_suite(tmp_path):
     assert len(loaded.tasks) == len(original.tasks)
     assert loaded.tasks[0].task_id == original.tasks[0].task_id
     assert loaded.tasks[0].metadata == original.tasks[0].metadata
+
+
+def test_roundtrip_suite_jsonl(tmp_path):
+    """Test save/load through the JSON Lines suite format."""
+    original = eval_tasks.EvalSuite(
+        name="streamed",
+        description="One task per line",
+        defaults={"test_cmd": "make test"},
+        tasks=[
+            eval_tasks.TaskSpec(task_id="t1", repo="/r1", goal="g1", metadata={"category": "a"}),
+            eval_tasks.TaskSpec(task_id="t2", repo="/r2", goal="g2", test_cmd="pytest"),
+        ],
+    )
+
+    path = tmp_path / "suite.jsonl"
+    eval_tasks.save_suite(original, path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0]) == {"name": "streamed", "description": "One task per line", "defaults": {"test_cmd": "make test"}}
+
+    loaded = eval_tasks.load_suite(path)
+    assert loaded.to_dict() == original.to_dict()
+
+
+def test_load_suite_jsonl_applies_defaults(tmp_path):
+    """Test JSON Lines suites apply header defaults to each task line."""
+    path = tmp_path / "suite.jsonl"
+    path.write_text(
+        json.dumps({"name": "s", "defaults": {"repo": "/default", "test_cmd": "pytest -q"}}) + "\n"
+        + json.dumps({"task_id": "t1", "goal": "g1"}) + "\n"
+        + "\n"
+        + json.dumps({"task_id": "t2", "goal": "g2", "repo": "/custom"}) + "\n",
+        encoding="utf-8",
+    )
+
+    suite = eval_tasks.load_suite(path)
+    assert suite.name == "s"
+    assert [t.repo for t in suite.tasks] == ["/default", "/custom"]
+    assert all(t.test_cmd == "pytest -q" for t in suite.tasks)
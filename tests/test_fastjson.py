@@ -0,0 +1,60 @@
+import json
+import math
+
+import pytest
+
+import llm_repo_agent.fastjson as fastjson
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        if fastjson.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(fastjson, "orjson", None)
+    return request.param
+
+
+def test_dumps_line_is_single_newline_terminated_line(backend):
+    obj = {"kind": "llm_request", "payload": {"content": "line1\nline2", "text": "héllo"}, "n": 1}
+    line = fastjson.dumps_line(obj)
+    assert isinstance(line, bytes)
+    assert line.endswith(b"\n")
+    assert line.count(b"\n") == 1
+    assert "héllo".encode("utf-8") in line
+    assert json.loads(line) == obj
+
+
+def test_loads_accepts_bytes_and_str(backend):
+    obj = {"a": [1, 2.5, None, True], "b": "x"}
+    assert fastjson.loads(json.dumps(obj)) == obj
+    assert fastjson.loads(json.dumps(obj).encode("utf-8")) == obj
+
+
+def test_dumps_line_non_str_keys(backend):
+    assert json.loads(fastjson.dumps_line({1: "a"})) == {"1": "a"}
+
+
+def test_dumps_line_wide_int_roundtrips(backend):
+    obj = {"args": {"max_files": 10**20}, "n": -(2**70)}
+    line = fastjson.dumps_line(obj)
+    assert line.endswith(b"\n")
+    assert fastjson.loads(line) == obj
+    assert fastjson.loads(line.decode("utf-8")) == obj
+
+
+def test_loads_accepts_nan_and_infinity_written_by_stdlib(backend):
+    line = json.dumps({"x": float("nan"), "y": float("inf"), "z": -float("inf")})
+    out = fastjson.loads(line.encode("utf-8"))
+    assert math.isnan(out["x"])
+    assert out["y"] == float("inf") and out["z"] == -float("inf")
+
+
+def test_dumps_line_deep_nesting_roundtrips(backend):
+    obj = []
+    for _ in range(300):
+        obj = [obj]
+    line = fastjson.dumps_line(obj)
+    assert line.count(b"\n") == 1
+    assert fastjson.loads(line) == obj
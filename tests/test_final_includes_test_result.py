@@ -1,10 +1,3 @@
-from pathlib import Path
-
-from llm_repo_agent.agent import RepoAgent, AgentConfig
-from llm_repo_agent.llm import LLM
-from llm_repo_agent.tools import RepoTools
-from llm_repo_agent.trace import Trace
-
 from llm_repo_agent.actions import ToolCallAction, FinalAction
 
 
@@ -26,15 +19,8 @@ class DummyLLM:
         return FinalAction(summary='Done', changes=[])
 
 
-def test_final_contains_test_result(tmp_path):
-    repo_root = tmp_path / "repo"
-    repo_root.mkdir()
-
-    tools = RepoTools(repo_root=repo_root)
-    trace = Trace(tmp_path / "trace.jsonl", run_id='r1')
-
-    llm = DummyLLM()
-    agent = RepoAgent(llm=llm, tools=tools, trace=trace, cfg=AgentConfig())
+def test_final_contains_test_result(agent_env):
+    agent = agent_env.make_agent(DummyLLM())
 
     # Use a quick passing command
     test_cmd = ["python", "-c", "print('ok')"]
@@ -1,10 +1,9 @@
-import json
 from pathlib import Path
 from llm_repo_agent.trace import Trace
 from llm_repo_agent.inspect_trace import pretty_print_events
 
 
-def test_pretty_print_full(tmp_path, capsys):
+def test_pretty_print_full(tmp_path, capsys, write_jsonl):
     trace_file = tmp_path / "trace.jsonl"
     # create a fake llm_request event with long content
     ev = {
@@ -19,7 +18,7 @@ def test_pretty_print_full(tmp_path, capsys):
         },
         "run_id": "r1",
     }
-    trace_file.write_text(json.dumps(ev) + "\n")
+    write_jsonl(trace_file, [ev])
 
     # read via Trace.iter_run_events and pretty_print full
     trace = Trace(trace_file, run_id="r1")
@@ -1,9 +1,8 @@
-import json
 from pathlib import Path
 from llm_repo_agent.inspect_trace import main
 
 
-def test_dump_prompt_writes_file(tmp_path, capsys):
+def test_dump_prompt_writes_file(tmp_path, capsys, write_jsonl):
     trace_file = tmp_path / "trace.jsonl"
     ev = {
         "ts": 1.0,
@@ -17,7 +16,7 @@ def test_dump_prompt_writes_file(tmp_path, capsys):
         },
         "run_id": "r1",
     }
-    trace_file.write_text(json.dumps(ev) + "\n")
+    write_jsonl(trace_file, [ev])
 
     dump_path = tmp_path / "prompt.txt"
 
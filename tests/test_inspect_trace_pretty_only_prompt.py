@@ -1,10 +1,9 @@
-import json
 from pathlib import Path
 from llm_repo_agent.trace import Trace
 from llm_repo_agent.inspect_trace import main
 
 
-def test_pretty_only_prompt(tmp_path, capsys):
+def test_pretty_only_prompt(tmp_path, capsys, write_jsonl):
     trace_file = tmp_path / "trace.jsonl"
     ev = {
         "ts": 1.0,
@@ -18,7 +17,7 @@ def test_pretty_only_prompt(tmp_path, capsys):
         },
         "run_id": "r1",
     }
-    trace_file.write_text(json.dumps(ev) + "\n")
+    write_jsonl(trace_file, [ev])
 
     # Invoke main with pretty-only-prompt
     rc = main([
@@ -1,9 +1,8 @@
-import json
 from pathlib import Path
 from llm_repo_agent.inspect_trace import main
 
 
-def test_prompt_with_history_single_line(tmp_path, capsys):
+def test_prompt_with_history_single_line(tmp_path, capsys, write_jsonl):
     trace_file = tmp_path / "trace.jsonl"
     # Build a small sequence of events: read, tool_call, llm_request with newlines, tool_result
     ev1 = {"ts": 1.0, "kind": "tool_call", "payload": {"name": "list_files", "args": {"rel_dir": "."}}, "run_id": "r1"}
@@ -19,7 +18,7 @@ def test_prompt_with_history_single_line(tmp_path, capsys):
     }
     ev4 = {"ts": 4.0, "kind": "tool_result", "payload": {"summary": "ok"}, "run_id": "r1"}
 
-    trace_file.write_text("\n".join(json.dumps(e) for e in [ev1, ev2, ev3, ev4]) + "\n")
+    write_jsonl(trace_file, [ev1, ev2, ev3, ev4])
 
     rc = main([
         "--trace",
@@ -50,3 +49,22 @@ def test_prompt_with_history_single_line(tmp_path, capsys):
     # HISTORY header and at least one history line should be present
     assert "HISTORY (events" in out
     assert "tool_call" in out or "tool_result" in out
+
+
+def test_prompt_with_history_flattens_all_line_breaks(tmp_path, capsys, write_jsonl):
+    trace_file = tmp_path / "trace.jsonl"
+    write_jsonl(trace_file, [
+        {"ts": 1.0, "kind": "llm_request", "run_id": "r1", "payload": {"t": 0, "messages": [
+            {"role": "user", "content": "a\u2028b\u2029c\x85d\x0be\x0cf\x1cg\r\nh\n"},
+        ]}},
+        {"ts": 2.0, "kind": "tool_result", "run_id": "r1", "payload": {"output": "1 passed\n"}},
+    ])
+
+    rc = main(["--trace", str(trace_file), "--run", "r1", "--kind", "llm_request",
+               "--index", "0", "--prompt-with-history"])
+    assert rc == 0
+
+    lines = capsys.readouterr().out.split("\n")
+    assert "PROMPT: user: a b c d e f g h" in lines
+    # Trailing newline in tool output does not leave a trailing space
+    assert any(l.endswith("[tool_result] tool_result 1 passed") for l in lines)
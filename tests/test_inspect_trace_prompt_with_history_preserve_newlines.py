@@ -1,9 +1,8 @@
-import json
 from pathlib import Path
 from llm_repo_agent.inspect_trace import main
 
 
-def test_prompt_with_history_preserve_newlines(tmp_path, capsys):
+def test_prompt_with_history_preserve_newlines(tmp_path, capsys, write_jsonl):
     trace_file = tmp_path / "trace.jsonl"
     # Build a small sequence of events: tool_call, llm_request with newlines, tool_result
     ev1 = {"ts": 1.0, "kind": "tool_call", "payload": {"name": "list_files", "args": {"rel_dir": "."}}, "run_id": "r1"}
@@ -18,7 +17,7 @@ def test_prompt_with_history_preserve_newlines(tmp_path, capsys):
     }
     ev3 = {"ts": 3.0, "kind": "tool_result", "payload": {"summary": "ok"}, "run_id": "r1"}
 
-    trace_file.write_text("\n".join(json.dumps(e) for e in [ev1, ev2, ev3]) + "\n")
+    write_jsonl(trace_file, [ev1, ev2, ev3])
 
     rc = main([
         "--trace",
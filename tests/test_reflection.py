@@ -1,7 +1,7 @@
 import pytest
 
 from llm_repo_agent.reflection import parse_reflection, ReflectionParseError
-from llm_repo_agent.history import History, Observation, ObservationEvent, ReflectionEvent
+from llm_repo_agent.history import DriverNoteEvent, History, Observation, ObservationEvent, ReflectionEvent
 from llm_repo_agent.reflection_controller import ReflectionController, ReflectionConfig
 from llm_repo_agent.trace import Trace
 from llm_repo_agent.reflection import Reflection
@@ -44,7 +44,31 @@ def test_history_reflection_dedup_next_focus_and_risks():
     assert second.next_focus is None  # dedupbed out because already seen
 
 
-def test_reflection_controller_gating_and_run(tmp_path):
+def test_history_reflection_cap_keeps_other_events_in_order():
+    h = History()
+    h.append_driver_note(DriverNoteEvent(note="start"))
+    h.append_reflection(ReflectionEvent(notes=["note a"], next_focus=None, risks=[]), max_reflections=1)
+    h.append_driver_note(DriverNoteEvent(note="middle"))
+    h.append_reflection(ReflectionEvent(notes=["note b"], next_focus=None, risks=[]), max_reflections=1)
+    assert [e.kind for e in h.events] == ["driver_note", "driver_note", "reflection"]
+    assert h.events[-1].notes == ["note b"]
+    # The evicted reflection no longer counts towards dedup
+    h.append_reflection(ReflectionEvent(notes=["note a"], next_focus=None, risks=[]), max_reflections=1)
+    assert h.events[-1].notes == ["note a"]
+    assert h.recent_reflections() == [h.events[-1]]
+
+
+def test_history_recent_reflections_window():
+    h = History()
+    for note in ["a", "b", "c"]:
+        h.append_reflection(ReflectionEvent(notes=[note], next_focus=None, risks=[]))
+        h.append_driver_note(DriverNoteEvent(note=f"after {note}"))
+    assert [r.notes for r in h.recent_reflections(2)] == [["b"], ["c"]]
+    assert [r.notes for r in h.recent_reflections()] == [["a"], ["b"], ["c"]]
+    assert h.recent_reflections(10) == h.recent_reflections()
+
+
+def test_reflection_controller_gating_and_run(tmp_path, read_jsonl):
     class DummyLLM:
         def __init__(self):
             self.called = False
@@ -75,5 +99,5 @@ def test_reflection_controller_gating_and_run(tmp_path):
     assert reflections[0].notes == ["n1"]
 
     # Trace has reflection event
-    trace_kinds = [line for line in (tmp_path / "trace.jsonl").read_text().splitlines() if '"reflection"' in line]
+    trace_kinds = [e["kind"] for e in read_jsonl(tmp_path / "trace.jsonl") if e["kind"] == "reflection"]
     assert trace_kinds
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import llm_repo_agent.agent as agent_module
@@ -7,7 +6,7 @@ import llm_repo_agent.trace as trace_module
 import llm_repo_agent.actions as actions_module
 
 
-def test_run_start_and_end_and_history(tmp_path):
+def test_run_start_and_end_and_history(tmp_path, read_jsonl):
     class DummyLLM:
         def __init__(self):
             self.calls = 0
@@ -35,8 +34,7 @@ def test_run_start_and_end_and_history(tmp_path):
     res = agent.run(goal="Lifecycle test", test_cmd=[])
     assert isinstance(res, dict)
 
-    lines = trace_file.read_text(encoding="utf-8").splitlines()
-    kinds = [json.loads(l)['kind'] for l in lines]
+    kinds = [e['kind'] for e in read_jsonl(trace_file)]
     assert 'run_start' in kinds
     assert 'run_end' in kinds
 
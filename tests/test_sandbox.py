@@ -1,5 +1,9 @@
+import os
+import shutil
 from pathlib import Path
 
+import pytest
+
 from llm_repo_agent.sandbox import materialize_repo_sandbox, cleanup_sandbox
 
 
@@ -29,3 +33,29 @@ def test_materialize_with_destination(tmp_path):
     sandbox = materialize_repo_sandbox(src, dest)
     assert sandbox.root == dest.resolve()
     assert (sandbox.root / "b.txt").read_text() == "hi"
+
+
+def test_materialize_preserves_file_mode(tmp_path):
+    src = tmp_path / "src_repo"
+    (src / "bin").mkdir(parents=True)
+    script = src / "bin" / "run.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+
+    sandbox = materialize_repo_sandbox(src, tmp_path / "sb")
+    copied = sandbox.root / "bin" / "run.sh"
+    assert copied.read_text() == "#!/bin/sh\necho hi\n"
+    assert copied.stat().st_mode & 0o777 == 0o755
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+def test_materialize_rejects_named_pipe_without_blocking(tmp_path):
+    src = tmp_path / "src_repo"
+    src.mkdir()
+    (src / "a.txt").write_text("hello")
+    os.mkfifo(src / "p")
+
+    with pytest.raises(shutil.Error, match="named pipe"):
+        materialize_repo_sandbox(src, tmp_path / "sb")
+    # Regular files are still copied before copytree reports the error
+    assert (tmp_path / "sb" / "a.txt").read_text() == "hello"
@@ -1,10 +1,5 @@
-import json
-from pathlib import Path
-
-from llm_repo_agent.agent import RepoAgent, AgentConfig
+from llm_repo_agent.agent import AgentConfig
 from llm_repo_agent.actions import ToolCallAction, FinalAction
-from llm_repo_agent.tools import RepoTools
-from llm_repo_agent.trace import Trace
 
 
 class DummyLLM:
@@ -24,44 +19,25 @@ class DummyLLM:
         return FinalAction(summary="Done", changes=[])
 
 
-def _count_test_events(trace_file: Path) -> int:
-    lines = trace_file.read_text(encoding="utf-8").splitlines()
-    return sum(1 for l in lines if json.loads(l).get("kind") == "tests")
-
+def _count_test_events(read_jsonl, trace) -> int:
+    return sum(1 for e in read_jsonl(trace.path) if e["kind"] == "tests")
 
-def test_test_policy_on_final_runs_once(tmp_path):
-    repo_root = tmp_path / "repo"
-    repo_root.mkdir()
-    trace_file = tmp_path / "trace.jsonl"
 
-    agent = RepoAgent(
-        llm=DummyLLM(),
-        tools=RepoTools(repo_root=repo_root),
-        trace=Trace(trace_file, run_id="r1"),
-        cfg=AgentConfig(test_policy="on_final"),
-    )
+def test_test_policy_on_final_runs_once(agent_env, read_jsonl):
+    agent = agent_env.make_agent(DummyLLM(), AgentConfig(test_policy="on_final"))
 
     final = agent.run(goal="goal", test_cmd=["python", "-c", "print('ok')"])
     assert final.get("type") == "final"
     assert final.get("test_result") is not None
 
-    assert _count_test_events(trace_file) == 1
-
+    assert _count_test_events(read_jsonl, agent_env.trace) == 1
 
-def test_test_policy_never_runs_zero_tests(tmp_path):
-    repo_root = tmp_path / "repo"
-    repo_root.mkdir()
-    trace_file = tmp_path / "trace.jsonl"
 
-    agent = RepoAgent(
-        llm=DummyLLM(),
-        tools=RepoTools(repo_root=repo_root),
-        trace=Trace(trace_file, run_id="r2"),
-        cfg=AgentConfig(test_policy="never"),
-    )
+def test_test_policy_never_runs_zero_tests(agent_env, read_jsonl):
+    agent = agent_env.make_agent(DummyLLM(), AgentConfig(test_policy="never"))
 
     final = agent.run(goal="goal", test_cmd=["python", "-c", "print('ok')"])
     assert final.get("type") == "final"
     assert "test_result" not in final
 
-    assert _count_test_events(trace_file) == 0
+    assert _count_test_events(read_jsonl, agent_env.trace) == 0
@@ -0,0 +1,140 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import llm_repo_agent.trace as trace_module
+
+
+def test_trace_handle_is_flushed_per_event_and_reopens_after_close(tmp_path):
+    trace_file = tmp_path / "trace.jsonl"
+    with trace_module.Trace(trace_file, run_id="r1") as trace:
+        trace.log("run_start", {"goal": "g"})
+        # Visible to readers without closing the handle.
+        assert [e["kind"] for e in trace.iter_run_events("r1")] == ["run_start"]
+
+    trace.log("run_end", {})
+    trace.close()
+    kinds = [json.loads(l)["kind"] for l in trace_file.read_text(encoding="utf-8").splitlines()]
+    assert kinds == ["run_start", "run_end"]
+
+
+def test_iter_run_events_filters_by_run_id(tmp_path, write_jsonl):
+    trace_file = tmp_path / "trace.jsonl"
+    write_jsonl(trace_file, [
+        {"kind": "a", "run_id": "r1", "payload": {}},
+        {"kind": "b", "run_id": "r2", "payload": {"note": "r1"}},  # quoted run_id elsewhere
+        {"kind": "c", "run_id": "r10", "payload": {}},
+        {"kind": "d", "run_id": 'q"1', "payload": {}},
+        {"kind": "e", "run_id": "r1", "payload": {}},
+    ])
+    trace = trace_module.Trace(trace_file, run_id="r1")
+    assert [e["kind"] for e in trace.iter_run_events("r1")] == ["a", "e"]
+    assert [e["kind"] for e in trace.iter_run_events('q"1')] == ["d"]
+
+
+def test_iter_run_events_kinds_filter(tmp_path, write_jsonl):
+    trace_file = tmp_path / "trace.jsonl"
+    write_jsonl(trace_file, [
+        {"kind": "llm_request", "run_id": "r1", "payload": {"text": "mentions \"tests\""}},
+        {"kind": "tests", "run_id": "r1", "payload": {"ok": True}},
+        {"kind": "tests", "run_id": "r2", "payload": {"ok": False}},
+        {"kind": "driver_note", "run_id": "r1", "payload": {}},
+    ])
+    trace = trace_module.Trace(trace_file, run_id="r1")
+    events = list(trace.iter_run_events("r1", kinds=["tests"]))
+    assert [(e["kind"], e["payload"]["ok"]) for e in events] == [("tests", True)]
+
+
+def test_zstd_trace_roundtrip_across_writers(tmp_path):
+    pytest.importorskip("zstandard")
+    trace_file = tmp_path / "trace.jsonl.zst"
+    first = trace_module.Trace(trace_file, run_id="r1")
+    first.log("tests", {"ok": True, "output": "1 passed"})
+    # Readable before close()
+    assert [e["kind"] for e in first.iter_run_events("r1")] == ["tests"]
+    first.close()
+
+    with trace_module.Trace(trace_file, run_id="r1") as second:
+        second.log("driver_note", {"t": 1, "note": "again"})
+
+    assert trace_file.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"  # zstd magic
+    assert [e["kind"] for e in second.iter_all_events()] == ["tests", "driver_note"]
+    assert second.get_run_history("r1") == [
+        {"kind": "observation", "tool": "driver.run_tests", "obs": {"ok": True, "output": "1 passed"}},
+    ]
+
+
+def test_zstd_trace_requires_package(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    trace = trace_module.Trace(tmp_path / "trace.jsonl.zst", run_id="r1")
+    with pytest.raises(ImportError, match="zstandard"):
+        trace.log("run_start", {})
+
+
+def _log_and_die(trace_file, run_id):
+    """Log one event from a child process that exits without closing the Trace."""
+    code = (
+        "import os, sys\n"
+        "from pathlib import Path\n"
+        "from llm_repo_agent.trace import Trace\n"
+        "trace = Trace(Path(sys.argv[1]), run_id=sys.argv[2])\n"
+        "trace.log('run_start', {'goal': 'killed'})\n"
+        "os._exit(0)\n"
+    )
+    src_dir = str(Path(trace_module.__file__).resolve().parents[1])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")])))
+    subprocess.run([sys.executable, "-c", code, str(trace_file), run_id], check=True, env=env)
+
+
+def test_zstd_trace_after_unclean_exit(tmp_path):
+    pytest.importorskip("zstandard")
+    trace_file = tmp_path / "trace.jsonl.zst"
+    with trace_module.Trace(trace_file, run_id="r0") as t0:
+        t0.log("run_start", {"goal": "clean"})
+    _log_and_die(trace_file, "r1")
+
+    with trace_module.Trace(trace_file, run_id="r2") as t2:
+        t2.log("run_start", {"goal": "next"})
+
+    assert [e["run_id"] for e in t2.iter_all_events()] == ["r0", "r1", "r2"]
+    assert list(tmp_path.iterdir()) == [trace_file]
+
+
+def test_zstd_trace_concurrent_writers(tmp_path):
+    pytest.importorskip("zstandard")
+    trace_file = tmp_path / "trace.jsonl.zst"
+    a = trace_module.Trace(trace_file, run_id="a")
+    b = trace_module.Trace(trace_file, run_id="b")
+    a.log("run_start", {"goal": "a"})
+    b.log("run_start", {"goal": "b"})
+    a.log("run_end", {})
+    b.log("run_end", {})
+    a.close()
+    b.close()
+
+    events = [(e["run_id"], e["kind"]) for e in a.iter_all_events()]
+    assert events == [("a", "run_start"), ("b", "run_start"), ("a", "run_end"), ("b", "run_end")]
+    assert list(tmp_path.iterdir()) == [trace_file]
+
+
+def test_zstd_trace_reader_stops_at_corrupt_data(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    # A cut-off frame followed by another frame, as a writer killed mid-write
+    # and a later append would leave
+    buf = io.BytesIO()
+    writer = zstandard.ZstdCompressor(level=3).stream_writer(buf, closefd=False)
+    writer.write(b'{"kind": "run_start", "run_id": "r1", "payload": {}}\n')
+    writer.flush()
+    trace_file = tmp_path / "trace.jsonl.zst"
+    trace_file.write_bytes(buf.getvalue() + zstandard.ZstdCompressor().compress(b'{"kind": "x", "run_id": "r2"}\n'))
+
+    trace = trace_module.Trace(trace_file, run_id="r1")
+    # Must not raise; events decoded in the same chunk as the damage are lost
+    events = list(trace.iter_all_events())
+    assert all(e["run_id"] == "r1" for e in events)
+    assert trace.get_run_history("r2") == []
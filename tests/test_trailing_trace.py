@@ -1,6 +1,4 @@
-import json
 from pathlib import Path
-from types import SimpleNamespace
 
 import llm_repo_agent.agent as agent_module
 import llm_repo_agent.tools as tools_module
@@ -8,7 +6,7 @@ import llm_repo_agent.trace as trace_module
 import llm_repo_agent.actions as actions_module
 
 
-def test_agent_logs_trailing_json(tmp_path):
+def test_agent_logs_trailing_json(tmp_path, read_jsonl):
     # Dummy LLM that sets _last_trailing and returns a final object
     class DummyLLM:
         def start_conversation(self, system_prompt, user_goal):
@@ -33,16 +31,11 @@ def test_agent_logs_trailing_json(tmp_path):
     assert isinstance(res, dict)
 
     # Read trace file and find the llm_trailing_text event
-    lines = trace_file.read_text(encoding="utf-8").splitlines()
-    kinds = [json.loads(l)['kind'] for l in lines]
+    events = read_jsonl(trace_file)
+    kinds = [e['kind'] for e in events]
     assert 'llm_trailing_text' in kinds
     # ensure payload contains our trailing snippet
-    ev = None
-    for l in lines:
-        data = json.loads(l)
-        if data['kind'] == 'llm_trailing_text':
-            ev = data
-            break
+    ev = next((e for e in events if e['kind'] == 'llm_trailing_text'), None)
     assert ev is not None
     assert 'trailing' in ev['payload']
     assert 'second' in ev['payload']['trailing']